@@ -11,9 +11,8 @@
 # that they have been altered from the originals.
 """The inequality to equality converter."""
 
-import copy
 import math
-from typing import List, Optional, Union, cast
+from typing import Iterable, List, Optional, Union
 
 import numpy as np
 
@@ -23,7 +22,6 @@ from ..problems.linear_constraint import LinearConstraint
 from ..problems.quadratic_constraint import QuadraticConstraint
 from ..problems.quadratic_objective import QuadraticObjective
 from ..problems.quadratic_program import QuadraticProgram
-from ..problems.variable import Variable
 from .quadratic_program_converter import QuadraticProgramConverter
 
 
@@ -52,6 +50,7 @@ class InequalityToEquality(QuadraticProgramConverter):
                    use continuous variables
         """
         self._src: Optional[QuadraticProgram] = None
+        self._src_num_vars: Optional[int] = None
         self._dst: Optional[QuadraticProgram] = None
         self._mode = mode
 
@@ -69,7 +68,11 @@ class InequalityToEquality(QuadraticProgramConverter):
             QiskitOptimizationError: If an unsupported mode is selected.
             QiskitOptimizationError: If an unsupported sense is specified.
         """
-        self._src = copy.deepcopy(problem)
+        # `problem` is only read during the conversion, so no copy is needed.
+        # `interpret` must not read it since the caller may modify it afterwards,
+        # so cache what it needs here.
+        self._src = problem
+        self._src_num_vars = problem.get_num_vars()
         self._dst = QuadraticProgram(name=problem.name)
 
         # set a converting mode
@@ -78,17 +81,7 @@ class InequalityToEquality(QuadraticProgramConverter):
             raise QiskitOptimizationError(f"Unsupported mode is selected: {mode}")
 
         # Copy variables
-        for x in self._src.variables:
-            if x.vartype == Variable.Type.BINARY:
-                self._dst.binary_var(name=x.name)
-            elif x.vartype == Variable.Type.INTEGER:
-                self._dst.integer_var(name=x.name, lowerbound=x.lowerbound, upperbound=x.upperbound)
-            elif x.vartype == Variable.Type.CONTINUOUS:
-                self._dst.continuous_var(
-                    name=x.name, lowerbound=x.lowerbound, upperbound=x.upperbound
-                )
-            else:
-                raise QiskitOptimizationError(f"Unsupported variable type {x.vartype}")
+        self._copy_variables(self._src, self._dst)
 
         # Copy the objective function
         constant = self._src.objective.constant
@@ -138,7 +131,7 @@ class InequalityToEquality(QuadraticProgramConverter):
         sense = constraint.sense
         name = constraint.name
 
-        any_float = self._any_float(linear.to_array())
+        any_float = self._any_float(linear.coefficients.values())
         mode = self._mode
         if mode == "integer":
             if any_float:
@@ -190,7 +183,8 @@ class InequalityToEquality(QuadraticProgramConverter):
         sense = constraint.sense
         name = constraint.name
 
-        any_float = self._any_float(linear.to_array()) or self._any_float(quadratic.to_array())
+        # the slack type is decided by the linear coefficients only
+        any_float = self._any_float(linear.coefficients.values())
         mode = self._mode
         if mode == "integer":
             if any_float:
@@ -245,29 +239,34 @@ class InequalityToEquality(QuadraticProgramConverter):
 
         Returns:
             The result of the original problem.
-        """
-        # convert back the optimization result into that of the original problem
-        names = [var.name for var in self._dst.variables]
 
-        # interpret slack variables
-        sol = {name: x[i] for i, name in enumerate(names)}
-        new_x = np.zeros(self._src.get_num_vars())
-        for i, var in enumerate(self._src.variables):
-            new_x[i] = sol[var.name]
-        return new_x
+        Raises:
+            QiskitOptimizationError: if the number of variables in the result differs from
+                                     that of the converted problem.
+        """
+        if len(x) != self._dst.get_num_vars():
+            raise QiskitOptimizationError(
+                f"The number of variables in the passed result ({len(x)}) differs from "
+                f"that of the converted problem ({self._dst.get_num_vars()})."
+            )
+        # the original variables come first in the converted problem followed by slack variables,
+        # so dropping the slack variables is enough to convert back the result
+        return np.array(x[: self._src_num_vars], dtype=float)
 
     @staticmethod
-    def _any_float(values: np.ndarray) -> bool:
-        """Check whether the list contains float or not.
+    def _any_float(values: Iterable[float]) -> bool:
+        """Check whether the values contain a non-integral value or not.
         This method is used to check whether a constraint contain float coefficients or not.
 
         Args:
-            values: Coefficients of the constraint
+            values: Stored coefficients of the constraint
 
         Returns:
             bool: If the constraint contains float coefficients, this returns True, else False.
         """
-        return any(isinstance(v, float) and not cast(float, v).is_integer() for v in values)
+        # check all values at once instead of calling `float.is_integer` for each of them
+        arr = np.fromiter(values, dtype=float)
+        return not np.all(np.isfinite(arr) & (arr == np.floor(arr)))
 
     @property
     def mode(self) -> str:
@@ -16,6 +16,7 @@ import copy
 from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
+from scipy.sparse import csr_matrix
 
 from .quadratic_program_converter import QuadraticProgramConverter
 from ..exceptions import QiskitOptimizationError
@@ -50,6 +51,9 @@ class IntegerToBinary(QuadraticProgramConverter):
         self._dst: Optional[QuadraticProgram] = None
         self._conv: Dict[Variable, List[Tuple[str, int]]] = {}
         # e.g., self._conv = {x: [('x@1', 1), ('x@2', 2)]}
+        # linear map from the converted variables back to the original ones, used by interpret
+        self._interpret_matrix: Optional[csr_matrix] = None
+        self._interpret_offset: Optional[np.ndarray] = None
 
     def convert(self, problem: QuadraticProgram) -> QuadraticProgram:
         """Convert an integer problem into a new problem with binary variables.
@@ -64,8 +68,17 @@ class IntegerToBinary(QuadraticProgramConverter):
             QiskitOptimizationError: if variable or constraint type is not supported.
         """
 
-        # Copy original QP as reference.
-        self._src = copy.deepcopy(problem)
+        # Keep original QP as reference. It is only read during the conversion.
+        # `interpret` must not read it since the caller may modify it afterwards, so the map
+        # from the converted variables back to the original ones is cached below.
+        self._src = problem
+        self._conv = {}
+
+        num_vars = self._src.get_num_vars()
+        rows: List[int] = []
+        cols: List[int] = []
+        coeffs: List[float] = []
+        offset = np.zeros(num_vars)
 
         if self._src.get_num_integer_vars() > 0:
 
@@ -73,13 +86,20 @@ class IntegerToBinary(QuadraticProgramConverter):
             self._dst = QuadraticProgram(name=problem.name)
 
             # Declare variables
-            for x in self._src.variables:
+            for i, x in enumerate(self._src.variables):
                 if x.vartype == Variable.Type.INTEGER:
                     new_vars = self._convert_var(x.name, x.lowerbound, x.upperbound)
                     self._conv[x] = new_vars
-                    for (var_name, _) in new_vars:
+                    for (var_name, coef) in new_vars:
+                        rows.append(i)
+                        cols.append(self._dst.get_num_vars())
+                        coeffs.append(coef)
                         self._dst.binary_var(var_name)
+                    offset[i] = x.lowerbound
                 else:
+                    rows.append(i)
+                    cols.append(self._dst.get_num_vars())
+                    coeffs.append(1.0)
                     if x.vartype == Variable.Type.CONTINUOUS:
                         self._dst.continuous_var(x.lowerbound, x.upperbound, x.name)
                     elif x.vartype == Variable.Type.BINARY:
@@ -94,6 +114,13 @@ class IntegerToBinary(QuadraticProgramConverter):
         else:
             # just copy the problem if no integer variables exist
             self._dst = copy.deepcopy(problem)
+            rows = cols = list(range(num_vars))
+            coeffs = [1.0] * num_vars
+
+        self._interpret_matrix = csr_matrix(
+            (coeffs, (rows, cols)), shape=(num_vars, self._dst.get_num_vars()), dtype=float
+        )
+        self._interpret_offset = offset
 
         return self._dst
 
@@ -108,12 +135,16 @@ class IntegerToBinary(QuadraticProgramConverter):
         return [(name + self._delimiter + str(i), coef) for i, coef in enumerate(coeffs)]
 
     def _convert_linear_coefficients_dict(
-        self, coefficients: Dict[str, float]
+        self, coefficients: Dict[int, float]
     ) -> Tuple[Dict[str, float], float]:
         constant = 0.0
         linear: Dict[str, float] = {}
-        for name, v in coefficients.items():
-            x = self._src.get_variable(name)
+        variables = self._src.variables
+        for i, v in coefficients.items():
+            if v == 0.0:
+                # explicitly stored zeros do not contribute to the converted expression
+                continue
+            x = variables[i]
             if x in self._conv:
                 for y, coeff in self._conv[x]:
                     linear[y] = v * coeff
@@ -124,14 +155,18 @@ class IntegerToBinary(QuadraticProgramConverter):
         return linear, constant
 
     def _convert_quadratic_coefficients_dict(
-        self, coefficients: Dict[Tuple[str, str], float]
-    ) -> Tuple[Dict[Tuple[str, str], float], Dict[str, float], float]:
+        self, coefficients: Dict[Tuple[int, int], float], linear: Dict[str, float]
+    ) -> Tuple[Dict[Tuple[str, str], float], float]:
+        # linear terms arising from the lower bounds are accumulated into `linear` in place
         constant = 0.0
-        linear: Dict[str, float] = {}
         quadratic = {}
-        for (name_i, name_j), v in coefficients.items():
-            x = self._src.get_variable(name_i)
-            y = self._src.get_variable(name_j)
+        variables = self._src.variables
+        for (i, j), v in coefficients.items():
+            if v == 0.0:
+                # explicitly stored zeros do not contribute to the converted expression
+                continue
+            x = variables[i]
+            y = variables[j]
 
             if x in self._conv and y not in self._conv:
                 for z_x, coeff_x in self._conv[x]:
@@ -158,21 +193,19 @@ class IntegerToBinary(QuadraticProgramConverter):
             else:
                 quadratic[x.name, y.name] = v
 
-        return quadratic, linear, constant
+        return quadratic, constant
 
     def _substitute_int_var(self):
 
         # set objective
         linear, linear_constant = self._convert_linear_coefficients_dict(
-            self._src.objective.linear.to_dict(use_name=True)
+            self._src.objective.linear.to_dict()
         )
-        quadratic, q_linear, q_constant, = self._convert_quadratic_coefficients_dict(
-            self._src.objective.quadratic.to_dict(use_name=True)
+        quadratic, q_constant = self._convert_quadratic_coefficients_dict(
+            self._src.objective.quadratic.to_dict(), linear
         )
 
         constant = self._src.objective.constant + linear_constant + q_constant
-        for i, v in q_linear.items():
-            linear[i] = linear.get(i, 0) + v
 
         if self._src.objective.sense == QuadraticObjective.Sense.MINIMIZE:
             self._dst.minimize(constant, linear, quadratic)
@@ -181,9 +214,7 @@ class IntegerToBinary(QuadraticProgramConverter):
 
         # set linear constraints
         for constraint in self._src.linear_constraints:
-            linear, constant = self._convert_linear_coefficients_dict(
-                constraint.linear.to_dict(use_name=True)
-            )
+            linear, constant = self._convert_linear_coefficients_dict(constraint.linear.to_dict())
             self._dst.linear_constraint(
                 linear, constraint.sense, constraint.rhs - constant, constraint.name
             )
@@ -191,15 +222,13 @@ class IntegerToBinary(QuadraticProgramConverter):
         # set quadratic constraints
         for constraint in self._src.quadratic_constraints:
             linear, linear_constant = self._convert_linear_coefficients_dict(
-                constraint.linear.to_dict(use_name=True)
+                constraint.linear.to_dict()
             )
-            quadratic, q_linear, q_constant = self._convert_quadratic_coefficients_dict(
-                constraint.quadratic.to_dict(use_name=True)
+            quadratic, q_constant = self._convert_quadratic_coefficients_dict(
+                constraint.quadratic.to_dict(), linear
             )
 
             constant = linear_constant + q_constant
-            for i, v in q_linear.items():
-                linear[i] = linear.get(i, 0) + v
 
             self._dst.quadratic_constraint(
                 linear,
@@ -218,13 +247,15 @@ class IntegerToBinary(QuadraticProgramConverter):
 
         Returns:
             The result of the original problem.
+
+        Raises:
+            QiskitOptimizationError: if the number of variables in the result differs from
+                                     that of the converted problem.
         """
-        # interpret integer values
-        sol = {var.name: x[i] for i, var in enumerate(self._dst.variables)}
-        new_x = np.zeros(self._src.get_num_vars())
-        for i, var in enumerate(self._src.variables):
-            if var in self._conv:
-                new_x[i] = sum(sol[aux] * coef for aux, coef in self._conv[var]) + var.lowerbound
-            else:
-                new_x[i] = sol[var.name]
-        return np.array(new_x)
+        if len(x) != self._interpret_matrix.shape[1]:
+            raise QiskitOptimizationError(
+                f"The number of variables in the passed result ({len(x)}) differs from "
+                f"that of the converted problem ({self._interpret_matrix.shape[1]})."
+            )
+        # each original variable is a weighted sum of its binary variables plus its lower bound
+        return self._interpret_matrix @ np.asarray(x, dtype=float) + self._interpret_offset
@@ -13,7 +13,7 @@
 """Converter to convert a problem with equality constraints to unconstrained with penalty terms."""
 
 import logging
-from typing import Optional, cast, Union, Tuple, List
+from typing import Optional, Union, Tuple, List
 
 import numpy as np
 
@@ -22,11 +22,15 @@ from ..exceptions import QiskitOptimizationError
 from ..problems.constraint import Constraint
 from ..problems.quadratic_objective import QuadraticObjective
 from ..problems.quadratic_program import QuadraticProgram
-from ..problems.variable import Variable
 
 logger = logging.getLogger(__name__)
 
 
+def _key(i: int, j: int) -> Tuple[int, int]:
+    """Returns the canonical (upper-triangular) key of a pair of variable indices."""
+    return (i, j) if i <= j else (j, i)
+
+
 class LinearEqualityToPenalty(QuadraticProgramConverter):
     """Convert a problem with only equality constraints to unconstrained with penalty terms."""
 
@@ -65,15 +69,7 @@ class LinearEqualityToPenalty(QuadraticProgramConverter):
             penalty = self._penalty
 
         # Set variables
-        for x in problem.variables:
-            if x.vartype == Variable.Type.CONTINUOUS:
-                dst.continuous_var(x.lowerbound, x.upperbound, x.name)
-            elif x.vartype == Variable.Type.BINARY:
-                dst.binary_var(x.name)
-            elif x.vartype == Variable.Type.INTEGER:
-                dst.integer_var(x.lowerbound, x.upperbound, x.name)
-            else:
-                raise QiskitOptimizationError("Unsupported vartype: {}".format(x.vartype))
+        self._copy_variables(problem, dst)
 
         # get original objective terms
         offset = problem.objective.constant
@@ -91,7 +87,10 @@ class LinearEqualityToPenalty(QuadraticProgramConverter):
                 )
 
             constant = constraint.rhs
-            row = constraint.linear.to_dict()
+            # explicitly stored zeros do not contribute to the penalty terms
+            row = {
+                j: coef for (_, j), coef in constraint.linear.coefficients.items() if coef != 0.0
+            }
 
             # constant parts of penalty*(Constant-func)**2: penalty*(Constant**2)
             offset += sense * penalty * constant ** 2
@@ -103,16 +102,18 @@ class LinearEqualityToPenalty(QuadraticProgramConverter):
                 linear[j] = linear.get(j, 0.0) + sense * penalty * -2 * coef * constant
 
             # quadratic parts of penalty*(Constant-func)**2: penalty*(func**2)
-            for j, coef_1 in row.items():
-                for k, coef_2 in row.items():
+            terms = list(row.items())
+            for pos, (j, coef_1) in enumerate(terms):
+                # visit each unordered pair once; (j, k) and (k, j) both contribute to
+                # the off-diagonal term, so it is doubled
+                quadratic[j, j] = quadratic.get((j, j), 0.0) + sense * penalty * coef_1 ** 2
+                for k, coef_2 in terms[pos + 1 :]:
                     # if j and k already exist in the quadratic terms dict,
                     # add a penalty term into existing value
-                    # else create new key and value in the quadratic term dict
-
-                    # according to implementation of quadratic terms in OptimizationModel,
-                    # don't need to multiply by 2, since loops run over (x, y) and (y, x).
-                    tup = cast(Union[Tuple[int, int], Tuple[str, str]], (j, k))
-                    quadratic[tup] = quadratic.get(tup, 0.0) + sense * penalty * coef_1 * coef_2
+                    # else create new key and value in the quadratic term dict.
+                    # The upper-triangular key matches the storage of QuadraticExpression.
+                    tup = _key(j, k)
+                    quadratic[tup] = quadratic.get(tup, 0.0) + 2 * sense * penalty * coef_1 * coef_2
 
         if problem.objective.sense == QuadraticObjective.Sense.MINIMIZE:
             dst.minimize(offset, linear, quadratic)
@@ -141,7 +142,7 @@ class LinearEqualityToPenalty(QuadraticProgramConverter):
         terms = []
         for constraint in problem.linear_constraints:
             terms.append(constraint.rhs)
-            terms.extend(constraint.linear.to_array().tolist())
+            terms.extend(constraint.linear.coefficients.values())
         if any(isinstance(term, float) and not term.is_integer() for term in terms):
             logger.warning(
                 "Warning: Using %f for the penalty coefficient because "
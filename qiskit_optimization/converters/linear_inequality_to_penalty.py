@@ -13,7 +13,7 @@
 """Converter to convert a problem with inequality constraints to unconstrained with penalty terms."""
 
 import logging
-from typing import Optional, Union, Tuple, List, Dict
+from typing import Optional, Union, Tuple, List, Dict, FrozenSet
 
 import numpy as np
 
@@ -106,15 +106,7 @@ class LinearInequalityToPenalty(QuadraticProgramConverter):
             penalty = self._penalty
 
         # Set variables
-        for x in problem.variables:
-            if x.vartype == Variable.Type.CONTINUOUS:
-                self._dst.continuous_var(x.lowerbound, x.upperbound, x.name)
-            elif x.vartype == Variable.Type.BINARY:
-                self._dst.binary_var(x.name)
-            elif x.vartype == Variable.Type.INTEGER:
-                self._dst.integer_var(x.lowerbound, x.upperbound, x.name)
-            else:
-                raise QiskitOptimizationError(f"Unsupported vartype: {x.vartype}")
+        self._copy_variables(problem, self._dst)
 
         # get original objective terms
         offset = problem.objective.constant
@@ -122,11 +114,19 @@ class LinearInequalityToPenalty(QuadraticProgramConverter):
         quadratic = problem.objective.quadratic.to_dict()
         sense = problem.objective.sense.value
 
+        # indices of binary variables, used to check constraints without per-term lookups
+        binary_indices = frozenset(
+            i for i, x in enumerate(problem.variables) if x.vartype == Variable.Type.BINARY
+        )
+
         # convert linear constraints into penalty terms
         for constraint in problem.linear_constraints:
 
+            # the coefficients are shared by the check and the conversion below
+            row = constraint.linear.to_dict()
+
             # special constraint check function here
-            if not self._is_matched_constraint(problem, constraint):
+            if not self._is_matched_constraint(binary_indices, constraint, row):
                 self._dst.linear_constraint(
                     constraint.linear.coefficients,
                     constraint.sense,
@@ -135,7 +135,9 @@ class LinearInequalityToPenalty(QuadraticProgramConverter):
                 )
                 continue
 
-            conv_offset, conv_linear, conv_quadratic, varmap = self._conversion_table(constraint)
+            conv_offset, conv_linear, conv_quadratic, varmap = self._conversion_table(
+                constraint, row
+            )
 
             # constant part
             offset += sense * penalty * conv_offset
@@ -184,9 +186,14 @@ class LinearInequalityToPenalty(QuadraticProgramConverter):
     @staticmethod
     def _conversion_table(
         constraint,
+        vars_dict: Dict[int, float],
     ) -> Tuple[int, np.ndarray, np.ndarray, Dict[int, int]]:
         """Construct conversion matrix for special constraint.
 
+        Args:
+            constraint: The linear constraint to be converted.
+            vars_dict: The linear coefficients of the constraint as a dictionary.
+
         Returns:
             Return conversion table which is used to construct
             penalty term in main function.
@@ -195,7 +202,6 @@ class LinearInequalityToPenalty(QuadraticProgramConverter):
             QiskitOptimizationError: if the constraint is invalid.
         """
 
-        vars_dict = constraint.linear.to_dict()
         coeffs = list(vars_dict.values())
         varmap = dict(enumerate(vars_dict.keys()))
         rhs = constraint.rhs
@@ -243,22 +249,28 @@ class LinearInequalityToPenalty(QuadraticProgramConverter):
         return offset, linear, quadratic, varmap
 
     @staticmethod
-    def _is_matched_constraint(problem, constraint) -> bool:
+    def _is_matched_constraint(
+        binary_indices: FrozenSet[int], constraint, params: Dict[int, float]
+    ) -> bool:
         """Determine if constraint is special or not.
 
+        Args:
+            binary_indices: The indices of the binary variables of the problem.
+            constraint: The linear constraint to be checked.
+            params: The linear coefficients of the constraint as a dictionary.
+
         Returns:
             True: when constraint is special
             False: when constraint is not special
         """
 
-        params = constraint.linear.to_dict()
         num_vars = len(params)
         rhs = constraint.rhs
         sense = constraint.sense
         coeff_array = np.array(list(params.values()))
 
         # Binary parameter?
-        if any(problem.variables[i].vartype != Variable.Type.BINARY for i in params.keys()):
+        if not binary_indices.issuperset(params):
             return False
 
         if num_vars == 2 and rhs == 0:
@@ -296,7 +308,7 @@ class LinearInequalityToPenalty(QuadraticProgramConverter):
         terms = []
         for constraint in problem.linear_constraints:
             terms.append(constraint.rhs)
-            terms.extend(constraint.linear.to_array().tolist())
+            terms.extend(constraint.linear.coefficients.values())
         if any(isinstance(term, float) and not term.is_integer() for term in terms):
             logger.warning(
                 "Warning: Using %f for the penalty coefficient because "
@@ -17,7 +17,9 @@ from typing import List, Union
 
 import numpy as np
 
+from ..exceptions import QiskitOptimizationError
 from ..problems.quadratic_program import QuadraticProgram
+from ..problems.variable import Variable
 
 
 class QuadraticProgramConverter(ABC):
@@ -36,3 +38,30 @@ class QuadraticProgramConverter(ABC):
     def interpret(self, x: Union[np.ndarray, List[float]]) -> np.ndarray:
         """Interpret a result into another form using the information of conversion"""
         raise NotImplementedError
+
+    @staticmethod
+    def _copy_variables(src: QuadraticProgram, dst: QuadraticProgram) -> None:
+        """Copy all variables of ``src`` into ``dst`` at once, keeping their order.
+
+        Binary variables are added with bounds 0 and 1 as in ``QuadraticProgram.binary_var``.
+
+        Raises:
+            QiskitOptimizationError: if a variable has an unsupported type.
+        """
+        names = []
+        lowerbounds = []
+        upperbounds = []
+        vartypes = []
+        for x in src.variables:
+            if x.vartype == Variable.Type.BINARY:
+                lowerbounds.append(0)
+                upperbounds.append(1)
+            elif x.vartype in (Variable.Type.INTEGER, Variable.Type.CONTINUOUS):
+                lowerbounds.append(x.lowerbound)
+                upperbounds.append(x.upperbound)
+            else:
+                raise QiskitOptimizationError(f"Unsupported vartype: {x.vartype}")
+            names.append(x.name)
+            vartypes.append(x.vartype)
+        # pylint: disable=protected-access
+        dst._add_variables_bulk(names, lowerbounds, upperbounds, vartypes)
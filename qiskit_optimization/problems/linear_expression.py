@@ -16,7 +16,7 @@ from typing import List, Union, Dict, Any
 from dataclasses import dataclass
 
 from numpy import ndarray
-from scipy.sparse import spmatrix, dok_matrix
+from scipy.sparse import coo_matrix, dok_matrix, spmatrix
 
 from .quadratic_program_element import QuadraticProgramElement
 from ..exceptions import QiskitOptimizationError
@@ -97,12 +97,26 @@ class LinearExpression(QuadraticProgramElement):
         elif isinstance(coefficients, spmatrix):
             coefficients = dok_matrix(coefficients)
         elif isinstance(coefficients, dict):
-            coeffs = dok_matrix((1, self.quadratic_program.get_num_vars()))
+            # collect all entries first and build the matrix at once because assigning entries
+            # to a dok_matrix one by one is slow
+            n = self.quadratic_program.get_num_vars()
+            variables_index = self.quadratic_program.variables_index
+            values: Dict[int, float] = {}
             for index, value in coefficients.items():
                 if isinstance(index, str):
-                    index = self.quadratic_program.variables_index[index]
-                coeffs[0, index] = value
-            coefficients = coeffs
+                    index = variables_index[index]
+                elif not -n <= index < n:
+                    raise IndexError(f"index ({index}) out of range")
+                elif index < 0:
+                    # negative indices count from the end as with item assignment to dok_matrix
+                    index += n
+                values[index] = value
+            cols = [index for index, value in values.items() if value != 0]
+            coefficients = coo_matrix(
+                ([values[index] for index in cols], ([0] * len(cols), cols)),
+                shape=(1, n),
+                dtype=float,
+            ).todok()
         else:
             raise QiskitOptimizationError("Unsupported format for coefficients.")
         return coefficients
@@ -152,7 +166,7 @@ class LinearExpression(QuadraticProgramElement):
                 for (_, k), v in self._coefficients.items()
             }
         else:
-            return {k: v for (_, k), v in self._coefficients.items()}
+            return {int(k): v for (_, k), v in self._coefficients.items()}
 
     def evaluate(self, x: Union[ndarray, List, Dict[Union[int, str], float]]) -> float:
         """Evaluate the linear expression for given variables.
@@ -198,13 +212,18 @@ class LinearExpression(QuadraticProgramElement):
 
         """
         l_b = u_b = 0.0
-        for ind, coeff in self.to_dict().items():
-            x = self.quadratic_program.get_variable(ind)
+        variables = self.quadratic_program.variables
+        for (_, ind), coeff in self._coefficients.items():
+            x = variables[ind]
             if x.lowerbound == -INFINITY or x.upperbound == INFINITY:
                 raise QiskitOptimizationError(
                     f"Linear expression contains an unbounded variable: {x.name}"
                 )
-            lst = [coeff * x.lowerbound, coeff * x.upperbound]
-            l_b += min(lst)
-            u_b += max(lst)
+            # the sign of the coefficient decides which bound gives the minimum
+            if coeff >= 0:
+                l_b += coeff * x.lowerbound
+                u_b += coeff * x.upperbound
+            else:
+                l_b += coeff * x.upperbound
+                u_b += coeff * x.lowerbound
         return ExpressionBounds(lowerbound=l_b, upperbound=u_b)
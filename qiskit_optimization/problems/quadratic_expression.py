@@ -16,7 +16,7 @@ from typing import List, Union, Dict, Tuple, Any
 
 import numpy as np
 from numpy import ndarray
-from scipy.sparse import spmatrix, dok_matrix, tril, triu
+from scipy.sparse import coo_matrix, dok_matrix, spmatrix, tril, triu
 
 from .quadratic_program_element import QuadraticProgramElement
 from ..exceptions import QiskitOptimizationError
@@ -105,15 +105,31 @@ class QuadraticExpression(QuadraticProgramElement):
         if isinstance(coefficients, (list, ndarray, spmatrix)):
             coefficients = dok_matrix(coefficients)
         elif isinstance(coefficients, dict):
+            # collect all entries first and build the matrix at once because assigning entries
+            # to a dok_matrix one by one is slow
             n = self.quadratic_program.get_num_vars()
-            coeffs = dok_matrix((n, n))
+            variables_index = self.quadratic_program.variables_index
+
+            def _index(key: Union[int, str]) -> int:
+                if isinstance(key, str):
+                    return variables_index[key]
+                if not -n <= key < n:
+                    raise IndexError(f"index ({key}) out of range")
+                # negative indices count from the end as with item assignment to dok_matrix
+                return key + n if key < 0 else key
+
+            values: Dict[Tuple[int, int], float] = {}
             for (i, j), value in coefficients.items():
-                if isinstance(i, str):
-                    i = self.quadratic_program.variables_index[i]
-                if isinstance(j, str):
-                    j = self.quadratic_program.variables_index[j]
-                coeffs[i, j] = value
-            coefficients = coeffs
+                values[_index(i), _index(j)] = value
+            keys = [key for key, value in values.items() if value != 0]
+            coefficients = coo_matrix(
+                (
+                    [values[key] for key in keys],
+                    ([i for i, _ in keys], [j for _, j in keys]),
+                ),
+                shape=(n, n),
+                dtype=float,
+            ).todok()
         else:
             raise QiskitOptimizationError(
                 "Unsupported format for coefficients: {}".format(coefficients)
@@ -255,13 +271,14 @@ class QuadraticExpression(QuadraticProgramElement):
             QiskitOptimizationError: if the quadratic expression contains any unbounded variable
         """
         l_b = u_b = 0.0
-        for (ind1, ind2), coeff in self.to_dict().items():
-            x = self.quadratic_program.get_variable(ind1)
+        variables = self.quadratic_program.variables
+        for (ind1, ind2), coeff in self._coefficients.items():
+            x = variables[ind1]
             if x.lowerbound == -INFINITY or x.upperbound == INFINITY:
                 raise QiskitOptimizationError(
                     f"Quadratic expression contains an unbounded variable: {x.name}"
                 )
-            y = self.quadratic_program.get_variable(ind2)
+            y = variables[ind2]
             if y.lowerbound == -INFINITY or y.upperbound == INFINITY:
                 raise QiskitOptimizationError(
                     f"Quadratic expression contains an unbounded variable: {y.name}"
@@ -281,7 +298,11 @@ class QuadraticExpression(QuadraticProgramElement):
                         x.upperbound * y.upperbound,
                     ]
                 )
-            lst2 = [coeff * val for val in lst]
-            l_b += min(lst2)
-            u_b += max(lst2)
+            # the sign of the coefficient decides which product gives the minimum
+            if coeff >= 0:
+                l_b += coeff * min(lst)
+                u_b += coeff * max(lst)
+            else:
+                l_b += coeff * max(lst)
+                u_b += coeff * min(lst)
         return ExpressionBounds(lowerbound=l_b, upperbound=u_b)
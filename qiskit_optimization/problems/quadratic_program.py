@@ -209,6 +209,36 @@ class QuadraticProgram:
             variables.append(variable)
         return names, variables
 
+    def _add_variables_bulk(
+        self,
+        names: Sequence[str],
+        lowerbounds: Sequence[Union[float, int]],
+        upperbounds: Sequence[Union[float, int]],
+        vartypes: Sequence[VarType],
+    ) -> List[Variable]:
+        """Appends variables with explicit names, bounds and types in the given order.
+
+        Unlike ``_add_variables``, no name generation is performed and the variable index is
+        updated at once. This is used by converters to copy the variables of another problem.
+
+        Raises:
+            QiskitOptimizationError: if a variable name already exists or is duplicated.
+        """
+        index: Dict[str, int] = {}
+        for i, name in enumerate(names, start=self.get_num_vars()):
+            if name in self._variables_index or name in index:
+                raise QiskitOptimizationError(f"Variable name already exists: {name}")
+            index[name] = i
+        variables = [
+            Variable(self, name, lowerbound, upperbound, vartype)
+            for name, lowerbound, upperbound, vartype in zip(
+                names, lowerbounds, upperbounds, vartypes
+            )
+        ]
+        self._variables.extend(variables)
+        self._variables_index.update(index)
+        return variables
+
     def _var_dict(
         self,
         keys: Union[int, Sequence],
@@ -1081,11 +1111,12 @@ class QuadraticProgram:
             )
 
         # check whether the input satisfy the bounds of the problem
-        violated_variables = []
-        for i, val in enumerate(x):
-            variable = self.get_variable(i)
-            if val < variable.lowerbound or variable.upperbound < val:
-                violated_variables.append(variable)
+        num_vars = self.get_num_vars()
+        values = np.asarray(x, dtype=float)
+        lowerbounds = np.fromiter((v.lowerbound for v in self._variables), float, num_vars)
+        upperbounds = np.fromiter((v.upperbound for v in self._variables), float, num_vars)
+        violated = (values < lowerbounds) | (upperbounds < values)
+        violated_variables = [self._variables[i] for i in np.flatnonzero(violated)]
 
         # check whether the input satisfy the constraints of the problem
         violated_constraints = []
@@ -16,7 +16,7 @@ import logging
 from collections import defaultdict
 from dataclasses import dataclass
 from math import isclose
-from typing import Dict, Optional, Tuple, Union, cast
+from typing import Dict, Optional, Tuple, Union
 
 from ..exceptions import QiskitOptimizationError
 from ..infinity import INFINITY
@@ -224,8 +224,9 @@ class _SubstituteVariables:
     def _linear_expression(self, lin_expr: LinearExpression) -> Tuple[float, LinearExpression]:
         const = 0.0
         lin_dict: Dict[str, float] = defaultdict(float)
-        for i, w_i in lin_expr.to_dict(use_name=True).items():
-            i = cast(str, i)
+        variables = self._src.variables
+        for (_, idx), w_i in lin_expr.coefficients.items():
+            i = variables[idx].name
             expr_i = self._subs.get(i, SubstitutionExpression(coeff=1, variable=i))
             const += w_i * expr_i.const
             if expr_i.variable:
@@ -241,9 +242,10 @@ class _SubstituteVariables:
         const = 0.0
         lin_dict: Dict[str, float] = defaultdict(float)
         quad_dict: Dict[Tuple[str, str], float] = defaultdict(float)
-        for (i, j), w_ij in quad_expr.to_dict(use_name=True).items():
-            i = cast(str, i)
-            j = cast(str, j)
+        variables = self._src.variables
+        for (idx, jdx), w_ij in quad_expr.coefficients.items():
+            i = variables[idx].name
+            j = variables[jdx].name
             expr_i = self._subs.get(i, SubstitutionExpression(coeff=1, variable=i))
             expr_j = self._subs.get(j, SubstitutionExpression(coeff=1, variable=j))
             const += w_ij * expr_i.const * expr_j.const
@@ -12,7 +12,7 @@
 
 """Translator between a docplex.mp model and a quadratic program"""
 
-from typing import Dict, Optional, Tuple, cast
+from typing import Dict, List, Optional, Tuple, Union
 
 from docplex.mp.constants import ComparisonType
 from docplex.mp.constr import (
@@ -29,11 +29,35 @@ from docplex.mp.vartype import BinaryVarType, ContinuousVarType, IntegerVarType
 
 from qiskit_optimization.exceptions import QiskitOptimizationError
 from qiskit_optimization.problems.constraint import Constraint
+from qiskit_optimization.problems.linear_expression import LinearExpression
+from qiskit_optimization.problems.quadratic_expression import QuadraticExpression
 from qiskit_optimization.problems.quadratic_objective import QuadraticObjective
 from qiskit_optimization.problems.quadratic_program import QuadraticProgram
 from qiskit_optimization.problems.variable import Variable
 
 
+def _linear_expr(
+    mdl: Model, var: List[Var], linear: LinearExpression
+) -> Union[int, AbstractLinearExpr]:
+    # An empty expression is kept as the constant 0 so that a constraint without terms becomes
+    # a plain bool, which docplex drops if it is trivially satisfied and rejects otherwise.
+    coeffs = linear.coefficients
+    if coeffs.nnz == 0:
+        return 0
+    # `scal_prod` builds the expression at once, while adding `v * var[i]` one by one creates
+    # an intermediate expression for every term
+    return mdl.scal_prod([var[i] for _, i in coeffs.keys()], list(coeffs.values()))
+
+
+def _quadratic_expr(
+    mdl: Model, var: List[Var], quadratic: QuadraticExpression
+) -> Union[int, QuadExpr]:
+    coeffs = quadratic.coefficients
+    if coeffs.nnz == 0:
+        return 0
+    return mdl.sum(v * var[i] * var[j] for (i, j), v in coeffs.items())
+
+
 def to_docplex_mp(quadratic_program: QuadraticProgram) -> Model:
     """Returns a docplex.mp model corresponding to a quadratic program.
 
@@ -50,24 +74,25 @@ def to_docplex_mp(quadratic_program: QuadraticProgram) -> Model:
     mdl = Model(quadratic_program.name)
 
     # add variables
-    var = {}
-    for idx, x in enumerate(quadratic_program.variables):
+    var = []
+    for x in quadratic_program.variables:
         if x.vartype == Variable.Type.CONTINUOUS:
-            var[idx] = mdl.continuous_var(lb=x.lowerbound, ub=x.upperbound, name=x.name)
+            var.append(mdl.continuous_var(lb=x.lowerbound, ub=x.upperbound, name=x.name))
         elif x.vartype == Variable.Type.BINARY:
-            var[idx] = mdl.binary_var(name=x.name)
+            var.append(mdl.binary_var(name=x.name))
         elif x.vartype == Variable.Type.INTEGER:
-            var[idx] = mdl.integer_var(lb=x.lowerbound, ub=x.upperbound, name=x.name)
+            var.append(mdl.integer_var(lb=x.lowerbound, ub=x.upperbound, name=x.name))
         else:
             # should never happen
             raise QiskitOptimizationError(f"Internal error: unsupported variable type: {x.vartype}")
 
     # add objective
-    objective = quadratic_program.objective.constant
-    for i, v in quadratic_program.objective.linear.to_dict().items():
-        objective += v * var[cast(int, i)]
-    for (i, j), v in quadratic_program.objective.quadratic.to_dict().items():
-        objective += v * var[cast(int, i)] * var[cast(int, j)]
+    # read coefficients from the sparse matrices directly instead of building dictionaries
+    objective = (
+        quadratic_program.objective.constant
+        + _linear_expr(mdl, var, quadratic_program.objective.linear)
+        + _quadratic_expr(mdl, var, quadratic_program.objective.quadratic)
+    )
     if quadratic_program.objective.sense == QuadraticObjective.Sense.MINIMIZE:
         mdl.minimize(objective)
     else:
@@ -79,9 +104,7 @@ def to_docplex_mp(quadratic_program: QuadraticProgram) -> Model:
         rhs = l_constraint.rhs
         if rhs == 0 and l_constraint.linear.coefficients.nnz == 0:
             continue
-        linear_expr = 0
-        for j, v in l_constraint.linear.to_dict().items():
-            linear_expr += v * var[cast(int, j)]
+        linear_expr = _linear_expr(mdl, var, l_constraint.linear)
         sense = l_constraint.sense
         if sense == Constraint.Sense.EQ:
             mdl.add_constraint(linear_expr == rhs, ctname=name)
@@ -103,11 +126,9 @@ def to_docplex_mp(quadratic_program: QuadraticProgram) -> Model:
             and q_constraint.quadratic.coefficients.nnz == 0
         ):
             continue
-        quadratic_expr = 0
-        for j, v in q_constraint.linear.to_dict().items():
-            quadratic_expr += v * var[cast(int, j)]
-        for (j, k), v in q_constraint.quadratic.to_dict().items():
-            quadratic_expr += v * var[cast(int, j)] * var[cast(int, k)]
+        quadratic_expr = _linear_expr(mdl, var, q_constraint.linear) + _quadratic_expr(
+            mdl, var, q_constraint.quadratic
+        )
         sense = q_constraint.sense
         if sense == Constraint.Sense.EQ:
             mdl.add_constraint(quadratic_expr == rhs, ctname=name)
@@ -12,8 +12,6 @@
 
 """Translator between a gurobipy model and a quadratic program"""
 
-from typing import cast
-
 try:
     import gurobipy as gp
     from gurobipy import Model
@@ -86,10 +84,10 @@ def to_gurobipy(quadratic_program: QuadraticProgram) -> Model:
 
     # add objective
     objective = quadratic_program.objective.constant
-    for i, v in quadratic_program.objective.linear.to_dict().items():
-        objective += v * var[cast(int, i)]
-    for (i, j), v in quadratic_program.objective.quadratic.to_dict().items():
-        objective += v * var[cast(int, i)] * var[cast(int, j)]
+    for (_, i), v in quadratic_program.objective.linear.coefficients.items():
+        objective += v * var[i]
+    for (i, j), v in quadratic_program.objective.quadratic.coefficients.items():
+        objective += v * var[i] * var[j]
     if quadratic_program.objective.sense == QuadraticObjective.Sense.MINIMIZE:
         mdl.setObjective(objective, sense=gp.GRB.MINIMIZE)
     else:
@@ -102,8 +100,8 @@ def to_gurobipy(quadratic_program: QuadraticProgram) -> Model:
         if rhs == 0 and l_constraint.linear.coefficients.nnz == 0:
             continue
         linear_expr = 0
-        for j, v in l_constraint.linear.to_dict().items():
-            linear_expr += v * var[cast(int, j)]
+        for (_, j), v in l_constraint.linear.coefficients.items():
+            linear_expr += v * var[j]
         sense = l_constraint.sense
         if sense == Constraint.Sense.EQ:
             mdl.addConstr(linear_expr == rhs, name=name)
@@ -126,10 +124,10 @@ def to_gurobipy(quadratic_program: QuadraticProgram) -> Model:
         ):
             continue
         quadratic_expr = 0
-        for j, v in q_constraint.linear.to_dict().items():
-            quadratic_expr += v * var[cast(int, j)]
-        for (j, k), v in q_constraint.quadratic.to_dict().items():
-            quadratic_expr += v * var[cast(int, j)] * var[cast(int, k)]
+        for (_, j), v in q_constraint.linear.coefficients.items():
+            quadratic_expr += v * var[j]
+        for (j, k), v in q_constraint.quadratic.coefficients.items():
+            quadratic_expr += v * var[j] * var[k]
         sense = q_constraint.sense
         if sense == Constraint.Sense.EQ:
             mdl.addConstr(quadratic_expr == rhs, name=name)
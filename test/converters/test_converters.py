@@ -164,6 +164,8 @@ class TestConverters(QiskitOptimizationTestCase):
 
         new_x = conv.interpret(np.arange(7))
         np.testing.assert_array_almost_equal(new_x, np.arange(3))
+        with self.assertRaises(QiskitOptimizationError):
+            conv.interpret(np.arange(3))
 
     def test_inequality_integer(self):
         """Test InequalityToEqualityConverter with integer variables"""
@@ -293,6 +295,31 @@ class TestConverters(QiskitOptimizationTestCase):
         lst = [op2.variables[3].vartype, op2.variables[4].vartype]
         self.assertListEqual(lst, [Variable.Type.INTEGER, Variable.Type.CONTINUOUS])
 
+    def test_interpret_after_modifying_source(self):
+        """Test interpret does not depend on the source problem modified after convert"""
+        op = QuadraticProgram()
+        op.binary_var(name="x")
+        op.integer_var(name="y", lowerbound=1, upperbound=4)
+        op.linear_constraint({"x": 1, "y": 1}, "<=", 3, "c0")
+
+        with self.subTest("InequalityToEquality"):
+            conv = InequalityToEquality()
+            op2 = conv.convert(op)
+            op.binary_var(name="z")
+            op.variables[1].upperbound = 10
+            np.testing.assert_array_almost_equal(conv.interpret([1, 2, 0]), [1, 2])
+            self.assertEqual(op2.get_num_vars(), 3)
+
+        op = QuadraticProgram()
+        op.binary_var(name="x")
+        op.integer_var(name="y", lowerbound=1, upperbound=4)
+        with self.subTest("IntegerToBinary"):
+            conv = IntegerToBinary()
+            _ = conv.convert(op)
+            op.binary_var(name="z")
+            op.variables[1].lowerbound = 0
+            np.testing.assert_array_almost_equal(conv.interpret([1, 1, 1]), [1, 4])
+
     def test_penalize_sense(self):
         """Test PenalizeLinearEqualityConstraints with senses"""
         op = QuadraticProgram()
@@ -387,6 +414,8 @@ class TestConverters(QiskitOptimizationTestCase):
         _ = conv.convert(op)
         new_x = conv.interpret([0, 1, 1, 1, 1])
         np.testing.assert_array_almost_equal(new_x, [0, 1, 5])
+        with self.assertRaises(QiskitOptimizationError):
+            conv.interpret([0, 1, 5])
 
     def test_optimizationproblem_to_ising(self):
         """Test optimization problem to operators"""
@@ -51,6 +51,27 @@ class TestLinearExpression(QiskitOptimizationTestCase):
             self.assertDictEqual(linear.to_dict(use_name=False), coefficients_dict_int)
             self.assertDictEqual(linear.to_dict(use_name=True), coefficients_dict_str)
 
+    def test_init_dict(self):
+        """test init with a dictionary containing zeros and duplicated variables."""
+
+        quadratic_program = QuadraticProgram()
+        for _ in range(5):
+            quadratic_program.continuous_var()
+
+        linear = LinearExpression(quadratic_program, {0: 1, "x1": 0, 2: 3, "x2": 2, "x0": 0})
+        self.assertEqual(linear.coefficients.nnz, 1)
+        self.assertDictEqual(linear.to_dict(), {2: 2})
+        self.assertTrue(all(type(k) is int for k in linear.to_dict()))
+        self.assertEqual(linear.coefficients.dtype, float)
+
+        # negative indices count from the end, the later entry wins
+        linear = LinearExpression(quadratic_program, {-1: 2, 1: 1, -4: 3})
+        self.assertDictEqual(linear.to_dict(), {4: 2, 1: 3})
+        with self.assertRaises(IndexError):
+            _ = LinearExpression(quadratic_program, {5: 1})
+        with self.assertRaises(IndexError):
+            _ = LinearExpression(quadratic_program, {-6: 1})
+
     def test_get_item(self):
         """test get_item."""
 
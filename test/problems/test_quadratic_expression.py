@@ -56,6 +56,30 @@ class TestQuadraticExpression(QiskitOptimizationTestCase):
             self.assertDictEqual(quadratic.to_dict(use_name=False), coefficients_dict_int)
             self.assertDictEqual(quadratic.to_dict(use_name=True), coefficients_dict_str)
 
+    def test_init_dict(self):
+        """test init with a dictionary containing zeros and duplicated variables."""
+
+        quadratic_program = QuadraticProgram()
+        for _ in range(5):
+            quadratic_program.continuous_var()
+
+        quadratic = QuadraticExpression(
+            quadratic_program,
+            {(0, 1): 1, ("x0", "x1"): 2, (1, 0): 3, (2, 2): 0, ("x3", "x4"): 0, (4, 3): 1},
+        )
+        self.assertEqual(quadratic.coefficients.nnz, 2)
+        self.assertDictEqual(quadratic.to_dict(), {(0, 1): 5, (3, 4): 1})
+        self.assertTrue(all(type(k) is int for key in quadratic.to_dict() for k in key))
+        self.assertEqual(quadratic.coefficients.dtype, float)
+
+        # negative indices count from the end
+        quadratic = QuadraticExpression(quadratic_program, {(-1, 0): 2, (1, -2): 1})
+        self.assertDictEqual(quadratic.to_dict(), {(0, 4): 2, (1, 3): 1})
+        with self.assertRaises(IndexError):
+            _ = QuadraticExpression(quadratic_program, {(0, 5): 1})
+        with self.assertRaises(IndexError):
+            _ = QuadraticExpression(quadratic_program, {(-6, 0): 1})
+
     def test_get_item(self):
         """test get_item."""
 
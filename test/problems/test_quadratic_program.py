@@ -22,6 +22,7 @@ from docplex.mp.model import DOcplexException, Model
 
 from qiskit.opflow import PauliSumOp
 from qiskit_optimization import INFINITY, QiskitOptimizationError, QuadraticProgram
+from qiskit_optimization.converters import QuadraticProgramConverter
 from qiskit_optimization.problems import Constraint, QuadraticObjective, Variable, VarType
 
 
@@ -472,6 +473,57 @@ class TestQuadraticProgram(QiskitOptimizationTestCase):
             self.assertEqual(x.name, z.name)
         self.assertDictEqual(quadratic_program.variables_index, {"x" + str(i): i for i in range(6)})
 
+    def test_add_variables_bulk(self):
+        """test _add_variables_bulk and copying variables with it"""
+        # pylint: disable=protected-access
+        quadratic_program = QuadraticProgram()
+        quadratic_program.binary_var(name="a")
+        variables = quadratic_program._add_variables_bulk(
+            ["z", "b", "y"],
+            [-1, 0, 2],
+            [5, 1, 4],
+            [Variable.Type.CONTINUOUS, Variable.Type.BINARY, Variable.Type.INTEGER],
+        )
+        self.assertListEqual([x.name for x in variables], ["z", "b", "y"])
+        self.assertListEqual([x.name for x in quadratic_program.variables], ["a", "z", "b", "y"])
+        self.assertDictEqual(quadratic_program.variables_index, {"a": 0, "z": 1, "b": 2, "y": 3})
+        self.assertListEqual([x.lowerbound for x in variables], [-1, 0, 2])
+        self.assertListEqual([x.upperbound for x in variables], [5, 1, 4])
+        self.assertListEqual(
+            [x.vartype for x in variables],
+            [Variable.Type.CONTINUOUS, Variable.Type.BINARY, Variable.Type.INTEGER],
+        )
+
+        with self.subTest("duplicate within names"):
+            with self.assertRaises(QiskitOptimizationError):
+                quadratic_program._add_variables_bulk(
+                    ["c", "c"], [0, 0], [1, 1], [Variable.Type.BINARY] * 2
+                )
+            self.assertEqual(quadratic_program.get_num_vars(), 4)
+            self.assertNotIn("c", quadratic_program.variables_index)
+
+        with self.subTest("existing name"):
+            with self.assertRaises(QiskitOptimizationError):
+                quadratic_program._add_variables_bulk(
+                    ["d", "z"], [0, 0], [1, 1], [Variable.Type.BINARY] * 2
+                )
+            self.assertListEqual(
+                [x.name for x in quadratic_program.variables], ["a", "z", "b", "y"]
+            )
+            self.assertDictEqual(
+                quadratic_program.variables_index, {"a": 0, "z": 1, "b": 2, "y": 3}
+            )
+
+        with self.subTest("binary bounds"):
+            # bounds are kept as given, while copying variables resets binary bounds to 0 and 1
+            # as `binary_var` does
+            quadratic_program.variables[2].upperbound = 0
+            dst = QuadraticProgram()
+            QuadraticProgramConverter._copy_variables(quadratic_program, dst)
+            self.assertListEqual([x.name for x in dst.variables], ["a", "z", "b", "y"])
+            self.assertListEqual([x.lowerbound for x in dst.variables], [0, -1, 0, 2])
+            self.assertListEqual([x.upperbound for x in dst.variables], [1, 5, 1, 4])
+
     def test_linear_constraints_handling(self):
         """test linear constraints handling"""
         q_p = QuadraticProgram()
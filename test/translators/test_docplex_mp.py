@@ -15,6 +15,7 @@
 from test.optimization_test_case import QiskitOptimizationTestCase
 
 from docplex.mp.model import Model
+from docplex.mp.utils import DOcplexException
 
 from qiskit_optimization.exceptions import QiskitOptimizationError
 from qiskit_optimization.problems import Constraint, QuadraticProgram
@@ -49,6 +50,31 @@ class TestDocplexMpTranslator(QiskitOptimizationTestCase):
         mod.add(2 * x - z + 3 * y * z == 1, "q0")
         self.assertEqual(q_p.export_as_lp_string(), mod.export_as_lp_string())
 
+    def test_to_with_empty_constraints(self):
+        """test to_docplex_mp with constraints without any terms"""
+        q_p = QuadraticProgram()
+        q_p.binary_var(name="x")
+        q_p.linear_constraint({}, "<=", 4)
+        q_p.quadratic_constraint({}, {}, ">=", -1)
+        q_p.linear_constraint({"x": 1}, "<=", 1)
+        # trivially satisfied constraints are dropped
+        mod = to_docplex_mp(q_p)
+        self.assertEqual(mod.number_of_constraints, 1)
+
+        with self.subTest("infeasible linear constraint"):
+            q_p = QuadraticProgram()
+            q_p.binary_var(name="x")
+            q_p.linear_constraint({}, "<=", -1)
+            with self.assertRaises(DOcplexException):
+                _ = to_docplex_mp(q_p)
+
+        with self.subTest("infeasible quadratic constraint"):
+            q_p = QuadraticProgram()
+            q_p.binary_var(name="x")
+            q_p.quadratic_constraint({}, {}, "==", 2)
+            with self.assertRaises(DOcplexException):
+                _ = to_docplex_mp(q_p)
+
     def test_from_without_variable_names(self):
         """test from_docplex_mp without explicit variable names"""
         mod = Model()